@@ -9,24 +9,134 @@ Design goals:
   1) a running summary of story-so-far
   2) a predefined chapter plot objective
 - Keep resumable state to survive interruptions/timeouts.
+- Generate the three books concurrently so a parallel-enabled Ollama server
+  overlaps their prefill/decode work.
+- Put the per-book static prompt content first and per-chapter content last,
+  so each book's chapter calls share a long cacheable prompt prefix.
+- With --memory-lag 1, overlap each chapter's summary/memory update with the
+  writing of the next chapter, so a book can have two requests in flight.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import http.client
 import json
 import os
 import re
+import socket
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-from urllib import error, request
+from urllib import request
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding when installed
+    orjson = None
 
 
 WORD_RE = re.compile(r"[A-Za-z0-9']+")
+# Same ASCII-only pattern for raw UTF-8 bytes: multi-byte characters never match
+# either form, so both count identically without decoding.
+WORD_RE_BYTES = re.compile(rb"[A-Za-z0-9']+")
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Story memory is injected into every chapter prompt; cap it so prefill stays flat.
+MEMORY_MAX_WORDS = 400
+# Leading slice of a chapter sent for summarization; plenty for a 140-word summary.
+SUMMARY_INPUT_CHARS = 8000
+# Sent with every request so Ollama keeps the model (and each slot's KV cache)
+# loaded between chapters. num_ctx must be identical on every call, otherwise
+# Ollama reloads the model with the new context size.
+KEEP_ALIVE = "30m"
+NUM_CTX = 8192
+# Longest gap allowed between streamed chunks once generation has started.
+STALL_TIMEOUT_SEC = 60
+# Longest wait for a summary/memory call's first token (time queued behind other
+# requests plus prefill); kept well under the chapter timeout so a stuck call
+# fails fast and retries.
+AUX_QUEUE_TIMEOUT_SEC = 60
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(raw: bytes | str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def write_json_file(path: Path, obj: Any, fsync: bool = False) -> None:
+    """Write obj to path as indented JSON straight into the file handle.
+
+    The stdlib fallback streams chunks via json.dump rather than building the
+    whole document as one string first.
+    """
+    if orjson is not None:
+        with path.open("wb") as fh:
+            fh.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            _finish_write(fh, fsync)
+    else:
+        with path.open("w", encoding="utf-8") as fh:
+            json.dump(obj, fh, indent=2)
+            _finish_write(fh, fsync)
+
+
+def _finish_write(fh: Any, fsync: bool) -> None:
+    if fsync:
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+# One lock per state file so concurrent books never interleave state writes.
+_STATE_LOCKS: dict[Path, asyncio.Lock] = {}
+
+
+class ChapterRounds:
+    """Release chapter-write requests from all active books together.
+
+    Each book waits in ready() before sending its next chapter request; the
+    round opens once every book still running is waiting, so the requests reach
+    Ollama in the same scheduling step and its batcher can decode them together.
+    """
+
+    def __init__(self, books: int) -> None:
+        self._active = books
+        self._waiting = 0
+        self._round = 0
+        self._cond = asyncio.Condition()
+
+    def _open_round(self) -> None:
+        self._waiting = 0
+        self._round += 1
+        self._cond.notify_all()
+
+    async def ready(self) -> None:
+        async with self._cond:
+            this_round = self._round
+            self._waiting += 1
+            if self._waiting >= self._active:
+                self._open_round()
+            else:
+                await self._cond.wait_for(lambda: self._round != this_round)
+
+    async def leave(self) -> None:
+        """Stop waiting for a book that has finished (or failed)."""
+        async with self._cond:
+            self._active -= 1
+            if self._waiting and self._waiting >= self._active:
+                self._open_round()
 
 
 @dataclass
@@ -35,70 +145,390 @@ class BookSpec:
     title: str
     premise: str
     tone: str
-    chapter_plans: list[str]
+    chapter_plans: tuple[str, ...]
+    # Lazily built by build_static_prefix(); identical for every chapter of the book.
+    _static_prefix: str | None = field(default=None, init=False, repr=False, compare=False)
 
 
 def now() -> str:
-    return datetime.now().strftime("%H:%M:%S")
+    return time.strftime("%H:%M:%S")
 
 
 def log(msg: str) -> None:
     print(f"[{now()}] {msg}", flush=True)
 
 
-def count_words(text: str) -> int:
-    return len(WORD_RE.findall(text))
+def iso_timestamp(value: Any) -> str:
+    # State stores epoch seconds; older state files stored ISO strings already.
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).isoformat()
+    return str(value)
 
 
-def post_json(url: str, payload: dict[str, Any], timeout_sec: int) -> dict[str, Any]:
-    raw = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=raw, method="POST")
-    req.add_header("Content-Type", "application/json")
-    with request.urlopen(req, timeout=timeout_sec) as resp:
-        body = resp.read().decode("utf-8", errors="replace")
-    return json.loads(body)
+def count_words(text: str | bytes) -> int:
+    # Iterate matches instead of materializing findall's list of tokens.
+    pattern = WORD_RE_BYTES if isinstance(text, bytes) else WORD_RE
+    return sum(1 for _ in pattern.finditer(text))
 
 
-def ollama_generate(
-    endpoint: str,
+class InFlight:
+    """Handle for aborting a request that a worker thread is blocked on.
+
+    The asyncio side cannot interrupt a thread sitting in a socket read, so
+    abort() shuts the socket down instead, which makes the read return at
+    once. Connections attached after abort() are refused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._conn: http.client.HTTPConnection | None = None
+        self._aborted = False
+
+    def attach(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if self._aborted:
+                raise ConnectionAbortedError("request cancelled")
+            self._conn = conn
+
+    def abort(self) -> None:
+        with self._lock:
+            self._aborted = True
+            conn = self._conn
+        if conn is not None and conn.sock is not None:
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections, keyed by host.
+
+    Ollama calls run in worker threads (one per concurrent book), so each
+    thread checks out its own connection and returns it once the response
+    has been read in full.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, key: tuple[str, str, int], timeout_sec: int) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout_sec
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout_sec)
+            return conn, True
+        scheme, host, port = key
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return conn_cls(host, port, timeout=timeout_sec), False
+
+    def _release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def open(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout_sec: float,
+        inflight: InFlight | None = None,
+    ) -> tuple[tuple[str, str, int], http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a request and return its response with headers read and body unread.
+
+        The caller must pass the result to finish() once the body is consumed,
+        or close the connection if reading fails. With inflight given, the
+        connection is attached to it once connected so the request can be aborted.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        key = (scheme, parts.hostname or "127.0.0.1", parts.port or (443 if scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        while True:
+            conn, reused = self._acquire(key, timeout_sec)
+            try:
+                if inflight is not None:
+                    # Connect first so abort() always finds a socket to shut down.
+                    if conn.sock is None:
+                        conn.connect()
+                    inflight.attach(conn)
+                conn.request(method, path, body=body, headers=headers)
+                return key, conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                # The server may drop an idle keep-alive connection; retry once on a fresh one.
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+    def finish(
+        self,
+        key: tuple[str, str, int],
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+    ) -> None:
+        if resp.will_close or not resp.isclosed():
+            conn.close()
+        else:
+            self._release(key, conn)
+
+
+_HTTP_POOL = ConnectionPool(maxsize=8)
+
+
+def keep_last_words(text: str, max_words: int) -> str:
+    """Trim text to at most its last max_words words, preferring a line boundary."""
+    starts = [m.start() for m in WORD_RE.finditer(text)]
+    if len(starts) <= max_words:
+        return text
+    cut = starts[-max_words]
+    if cut > 0 and text[cut - 1] != "\n":
+        # Drop the partial line so bullets stay intact, unless that empties the text.
+        newline = text.find("\n", cut)
+        if newline != -1 and text[newline:].strip():
+            cut = newline + 1
+    return text[cut:].strip()
+
+
+def post_stream(
+    url: str,
+    payload: dict[str, Any],
+    timeout_sec: int,
+    stall_timeout_sec: int,
+    queue_timeout_sec: int | None = None,
+    inflight: InFlight | None = None,
+) -> str:
+    """POST a streaming /api/generate request and return the concatenated response.
+
+    Ollama streams one JSON object per line. The whole call is bounded by
+    timeout_sec; once tokens start arriving, a gap longer than
+    stall_timeout_sec between lines aborts the call early. With
+    queue_timeout_sec set, that bounds the wait for the first line instead
+    (time spent queued behind other requests) and the timeout_sec budget only
+    starts once it arrives.
+    """
+    raw = _dumps(payload)
+    first_wait = timeout_sec if queue_timeout_sec is None else queue_timeout_sec
+    deadline = time.monotonic() + first_wait
+    key, conn, resp = _HTTP_POOL.open(
+        "POST",
+        url,
+        body=raw,
+        headers={"Content-Type": "application/json"},
+        timeout_sec=first_wait,
+        inflight=inflight,
+    )
+    try:
+        if resp.status < 200 or resp.status >= 300:
+            text = resp.read().decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP {resp.status} from {url}: {text[:200]}")
+
+        fragments: list[str] = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if not fragments and queue_timeout_sec is not None:
+                    raise TimeoutError(f"no token from Ollama within {queue_timeout_sec}s")
+                raise TimeoutError(f"Ollama stream exceeded {timeout_sec}s")
+            if conn.sock is not None:
+                conn.sock.settimeout(min(remaining, stall_timeout_sec) if fragments else remaining)
+            line = resp.readline()
+            if not line:
+                raise RuntimeError("Ollama stream ended before completion")
+            line = line.strip()
+            if not line:
+                continue
+            chunk = _loads(line)
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama error: {chunk['error']}")
+            fragments.append(str(chunk.get("response", "")))
+            if queue_timeout_sec is not None and len(fragments) == 1:
+                deadline = time.monotonic() + timeout_sec
+            if chunk.get("done"):
+                break
+        resp.read()
+    except BaseException:
+        conn.close()
+        raise
+    _HTTP_POOL.finish(key, conn, resp)
+    return "".join(fragments)
+
+
+async def stream_generate(
+    url: str,
+    payload: dict[str, Any],
+    timeout_sec: int,
+    stall_timeout_sec: int,
+    queue_timeout_sec: int | None = None,
+) -> str:
+    """Run post_stream() in a worker thread, aborting its request if cancelled.
+
+    Without the abort, a cancelled call (e.g. on Ctrl-C) would leave the thread
+    blocked on its socket and asyncio.run() would wait for it on exit.
+    """
+    inflight = InFlight()
+    try:
+        return await asyncio.to_thread(post_stream, url, payload, timeout_sec, stall_timeout_sec, queue_timeout_sec, inflight)
+    except asyncio.CancelledError:
+        inflight.abort()
+        raise
+
+
+def response_cache_path(cache_dir: Path, payload: dict[str, Any]) -> Path:
+    """Return the cache file for a generate payload.
+
+    The key covers everything that influences the output (model, prompts,
+    sampling options, format), so only identical requests share an entry.
+    """
+    key_fields = {
+        "model": payload["model"],
+        "system": payload["system"],
+        "prompt": payload["prompt"],
+        "format": payload.get("format"),
+        "options": payload["options"],
+    }
+    # Always stdlib json here so keys do not depend on whether orjson is installed.
+    key = hashlib.sha256(json.dumps(key_fields, sort_keys=True).encode("utf-8")).hexdigest()
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def read_cached_response(cache_path: Path) -> str | None:
+    try:
+        data = _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    response = data.get("response") if isinstance(data, dict) else None
+    return response if isinstance(response, str) and response else None
+
+
+def write_cached_response(cache_path: Path, response: str) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    tmp.write_bytes(_dumps({"response": response}))
+    tmp.replace(cache_path)
+
+
+def has_cached_response(
+    cache_dir: Path | None,
     model: str,
     system: str,
     prompt: str,
-    timeout_sec: int,
     temperature: float,
     seed: int | None,
-    retries: int = 3,
-) -> str:
-    url = endpoint.rstrip("/") + "/api/generate"
-    payload = {
+    num_predict: int = 4096,
+) -> bool:
+    """Whether ollama_generate() with these arguments would be answered from the cache."""
+    if cache_dir is None:
+        return False
+    payload = generate_payload(model, system, prompt, temperature, seed, num_predict)
+    return read_cached_response(response_cache_path(cache_dir, payload)) is not None
+
+
+def generate_payload(
+    model: str,
+    system: str,
+    prompt: str,
+    temperature: float,
+    seed: int | None,
+    num_predict: int,
+    response_format: str | None = None,
+    mirostat: int = 0,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
         "model": model,
         "system": system,
         "prompt": prompt,
-        "stream": False,
+        "stream": True,
+        "keep_alive": KEEP_ALIVE,
         "options": {
             "temperature": temperature,
             "top_p": 0.9,
-            "num_predict": 4096,
+            "num_predict": num_predict,
+            "num_ctx": NUM_CTX,
         },
     }
     if seed is not None:
         payload["options"]["seed"] = seed
+    if mirostat:
+        payload["options"]["mirostat"] = mirostat
+    if response_format is not None:
+        payload["format"] = response_format
+    return payload
+
+
+async def ollama_generate(
+    endpoint: str,
+    model: str,
+    system: str,
+    prompt: str,
+    timeout_sec: int,
+    temperature: float,
+    seed: int | None,
+    retries: int = 3,
+    num_predict: int = 4096,
+    response_format: str | None = None,
+    stall_timeout_sec: int = STALL_TIMEOUT_SEC,
+    cache_dir: Path | None = None,
+    queue_timeout_sec: int | None = None,
+    mirostat: int = 0,
+) -> str:
+    url = endpoint.rstrip("/") + "/api/generate"
+    payload = generate_payload(model, system, prompt, temperature, seed, num_predict, response_format, mirostat)
+
+    cache_path = response_cache_path(cache_dir, payload) if cache_dir is not None else None
+    if cache_path is not None:
+        cached = read_cached_response(cache_path)
+        if cached is not None:
+            return cached
 
     attempt = 0
     while True:
         attempt += 1
         try:
-            data = post_json(url, payload, timeout_sec=timeout_sec)
-            response = str(data.get("response", "")).strip()
+            # post_stream() enforces the deadlines itself and closes the
+            # connection when one passes, so the server stops generating too.
+            response = (await stream_generate(url, payload, timeout_sec, stall_timeout_sec, queue_timeout_sec)).strip()
             if not response:
                 raise RuntimeError("empty response from Ollama")
+            if cache_path is not None:
+                write_cached_response(cache_path, response)
             return response
-        except (error.URLError, TimeoutError, json.JSONDecodeError, RuntimeError) as exc:
+        except (OSError, http.client.HTTPException, json.JSONDecodeError, RuntimeError) as exc:
             if attempt >= retries:
                 raise RuntimeError(f"Ollama generation failed after {attempt} attempts: {exc}") from exc
-            sleep_s = attempt * 2
+            sleep_s = min(attempt * 2, 10)
             log(f"Retrying Ollama call ({attempt}/{retries}) after error: {exc}")
-            time.sleep(sleep_s)
+            await asyncio.sleep(sleep_s)
+
+
+async def warm_book_prefix(endpoint: str, model: str, spec: BookSpec, timeout_sec: int, seed: int | None) -> None:
+    """Prefill a book's system prompt and static prefix into an Ollama slot.
+
+    Generates a single token so later chapter calls only prefill their
+    per-chapter tail. Failures are logged and otherwise ignored.
+    """
+    url = endpoint.rstrip("/") + "/api/generate"
+    payload = generate_payload(model, chapter_system(spec), build_static_prefix(spec), 0.75, seed, num_predict=1)
+    try:
+        await stream_generate(url, payload, timeout_sec, STALL_TIMEOUT_SEC)
+    except (OSError, http.client.HTTPException, json.JSONDecodeError, RuntimeError) as exc:
+        log(f"{spec.genre.upper()} | prompt-cache warmup failed, continuing without it: {exc}")
 
 
 def check_ollama(endpoint: str, timeout_sec: int) -> None:
@@ -114,8 +544,9 @@ def check_ollama(endpoint: str, timeout_sec: int) -> None:
         ) from exc
 
 
-def default_specs() -> list[BookSpec]:
-    thriller_plans = [
+@functools.cache
+def default_specs() -> tuple[BookSpec, ...]:
+    thriller_plans = (
         "Open with an engineered blackout during a high-security data transfer; protagonist Mara traces an impossible access signature.",
         "Mara discovers the breach implicates her missing brother; show conflicting evidence and a near-capture in a train terminal.",
         "A whistleblower gives Mara a dead-man switch drive and is assassinated minutes later.",
@@ -140,8 +571,8 @@ def default_specs() -> list[BookSpec]:
         "They trigger a controlled shutdown but must choose between saving evidence and saving hostages.",
         "Final pursuit through flooded tunnels; Vale attempts escape with backup ledgers.",
         "Resolution: Vale exposed, brother's fate ambiguous, and Mara learns the network has successors.",
-    ]
-    romance_plans = [
+    )
+    romance_plans = (
         "Introduce Elena, a conservation architect, and Noah, a hotel developer, clashing over a historic seaside theater.",
         "City council grants temporary injunction; Elena and Noah must co-lead a feasibility study.",
         "Forced proximity: first site survey reveals hidden murals and Noah's genuine admiration for craft.",
@@ -166,8 +597,8 @@ def default_specs() -> list[BookSpec]:
         "Courtroom-adjacent climax: testimony from craftspeople and neighborhood elders secures injunction permanence.",
         "Grand gesture: Noah signs away controlling shares to protect theater covenants.",
         "Resolution: reopening night, committed partnership, and a future project together abroad.",
-    ]
-    fantasy_plans = [
+    )
+    fantasy_plans = (
         "Open in frostbound valley where apprentice mapmaker Ilya witnesses a starfall that awakens ancient runes.",
         "The village oracle reveals the starfall marks the return of the Hollow Crown.",
         "Ilya joins knight Ser Rowan and healer Tamsin on a quest to find the First Compass.",
@@ -192,8 +623,8 @@ def default_specs() -> list[BookSpec]:
         "Abyss breaches; team must fuse ward-stones while holding collapsing chamber.",
         "Ilya chooses to fracture Crown into three living oaths bound to companions.",
         "Resolution: kingdom enters uneasy peace; new order of map-keepers is founded.",
-    ]
-    return [
+    )
+    return (
         BookSpec(
             genre="thriller",
             title="Null Meridian",
@@ -215,7 +646,7 @@ def default_specs() -> list[BookSpec]:
             tone="epic, lyrical, adventurous with strong character bonds",
             chapter_plans=fantasy_plans,
         ),
-    ]
+    )
 
 
 def ensure_dir(path: Path) -> None:
@@ -225,21 +656,29 @@ def ensure_dir(path: Path) -> None:
 def read_state(state_path: Path) -> dict[str, Any] | None:
     if not state_path.exists():
         return None
-    return json.loads(state_path.read_text(encoding="utf-8"))
+    return _loads(state_path.read_bytes())
 
 
 def write_state(state_path: Path, state: dict[str, Any]) -> None:
     tmp = state_path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    write_json_file(tmp, state, fsync=True)
     tmp.replace(state_path)
 
 
-def summarize_chapter(
+async def save_state(state_path: Path, state: dict[str, Any]) -> None:
+    lock = _STATE_LOCKS.setdefault(state_path, asyncio.Lock())
+    async with lock:
+        await asyncio.to_thread(write_state, state_path, state)
+
+
+async def summarize_chapter(
     endpoint: str,
     model: str,
     chapter_text: str,
     timeout_sec: int,
     seed: int | None,
+    cache_dir: Path | None,
+    queue_timeout_sec: int | None = None,
 ) -> str:
     system = (
         "You summarize fiction chapters for continuity tracking. "
@@ -250,9 +689,9 @@ def summarize_chapter(
         "- Keep concrete facts.\n"
         "- Mention names, locations, stakes, and unresolved tensions.\n\n"
         "CHAPTER TEXT:\n"
-        f"{chapter_text[:12000]}"
+        f"{chapter_text[:SUMMARY_INPUT_CHARS]}"
     )
-    return ollama_generate(
+    return await ollama_generate(
         endpoint=endpoint,
         model=model,
         system=system,
@@ -260,16 +699,20 @@ def summarize_chapter(
         timeout_sec=timeout_sec,
         temperature=0.2,
         seed=seed,
+        cache_dir=cache_dir,
+        queue_timeout_sec=queue_timeout_sec,
     )
 
 
-def merge_memory(
+async def merge_memory(
     endpoint: str,
     model: str,
     previous_memory: str,
     latest_summary: str,
     timeout_sec: int,
     seed: int | None,
+    cache_dir: Path | None,
+    queue_timeout_sec: int | None = None,
 ) -> str:
     system = (
         "You maintain compact long-form story memory. "
@@ -285,7 +728,7 @@ def merge_memory(
         f"{latest_summary}\n\n"
         "Return updated memory now."
     )
-    return ollama_generate(
+    return await ollama_generate(
         endpoint=endpoint,
         model=model,
         system=system,
@@ -293,41 +736,233 @@ def merge_memory(
         timeout_sec=timeout_sec,
         temperature=0.2,
         seed=seed,
+        cache_dir=cache_dir,
+        queue_timeout_sec=queue_timeout_sec,
     )
 
 
-def make_chapter_prompt(
-    spec: BookSpec,
-    chapter_number: int,
-    chapter_goal: str,
-    story_memory: str,
-    target_words: int,
+async def summarize_and_merge(
+    endpoint: str,
+    model: str,
+    previous_memory: str,
+    chapter_text: str,
+    timeout_sec: int,
+    seed: int | None,
+    cache_dir: Path | None,
+    queue_timeout_sec: int | None = None,
 ) -> tuple[str, str]:
+    """Summarize a chapter and fold it into story memory with one Ollama call.
+
+    Raises ValueError when the model does not return the expected JSON object.
+    """
     system = (
+        "You maintain continuity notes for a long-form novel. "
+        "Reply with a single JSON object with exactly two string fields: "
+        '"summary" (plain text, max 140 words, focused on plot events, character state, and unresolved threads) and '
+        '"memory" (plain text bullet points only, max 350 words).'
+    )
+    prompt = (
+        "Summarize the chapter below for continuity memory, then update the running story memory with it.\n"
+        "- Summary: keep concrete facts; mention names, locations, stakes, and unresolved tensions.\n"
+        "- Memory: preserve continuity facts, unresolved threads, alliances, betrayals, emotional state changes, "
+        "and timeline markers. Drop fluff.\n\n"
+        "PREVIOUS MEMORY:\n"
+        f"{previous_memory}\n\n"
+        "CHAPTER TEXT:\n"
+        f"{chapter_text[:SUMMARY_INPUT_CHARS]}\n\n"
+        'Return {"summary": "...", "memory": "..."} now.'
+    )
+    raw = await ollama_generate(
+        endpoint=endpoint,
+        model=model,
+        system=system,
+        prompt=prompt,
+        timeout_sec=timeout_sec,
+        temperature=0.2,
+        seed=seed,
+        cache_dir=cache_dir,
+        queue_timeout_sec=queue_timeout_sec,
+        num_predict=1024,
+        response_format="json",
+    )
+    data = _loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    fields = []
+    for key in ("summary", "memory"):
+        value = data.get(key)
+        if isinstance(value, list):
+            value = "\n".join(f"- {item}" for item in value)
+        value = str(value or "").strip()
+        if not value:
+            raise ValueError(f"missing {key!r} in combined summary/memory response")
+        fields.append(value)
+    return fields[0], fields[1]
+
+
+def recent_notes(previous_summaries: list[str], chapter_summary: str) -> str:
+    """Stand-in story memory built from the latest summaries when a merge fails."""
+    tail = "\n".join([*previous_summaries, chapter_summary][-5:])
+    return f"Recent continuity notes:\n{tail}"
+
+
+async def update_continuity(
+    endpoint: str,
+    model: str,
+    chapter_no: int,
+    chapter_text: str,
+    previous_memory: str,
+    previous_summaries: list[str],
+    timeout_sec: int,
+    seed: int | None,
+    cache_dir: Path | None,
+    queue_timeout_sec: int | None = None,
+) -> tuple[str, str]:
+    """Return (chapter_summary, story_memory) after a chapter is written.
+
+    Tries the single combined call first and falls back to separate summary
+    and memory-merge calls only when its output cannot be parsed; if the call
+    itself fails, the separate calls would hit the same server, so the summary
+    is marked unavailable and memory falls back to recent summaries. timeout_sec
+    bounds the generation of each separate call once its first token arrives;
+    queue_timeout_sec bounds the wait before that.
+    """
+    try:
+        # The combined call reads the same chapter excerpt as summarize_chapter()
+        # and writes both outputs, so it gets the two separate budgets summed.
+        # With the defaults that is 60s queued + 180s generating, the 240s
+        # these calls used to share with chapter writes.
+        return await summarize_and_merge(
+            endpoint=endpoint,
+            model=model,
+            previous_memory=previous_memory,
+            chapter_text=chapter_text,
+            timeout_sec=2 * timeout_sec,
+            seed=seed,
+            cache_dir=cache_dir,
+            queue_timeout_sec=queue_timeout_sec,
+        )
+    except ValueError as exc:
+        log(f"Chapter {chapter_no} combined summary/memory response unusable ({exc}); using separate calls")
+    except RuntimeError as exc:
+        log(f"Chapter {chapter_no} combined summary/memory call failed ({exc})")
+        chapter_summary = f"Chapter {chapter_no} summary unavailable due to error: {exc}"
+        return chapter_summary, recent_notes(previous_summaries, chapter_summary)
+
+    try:
+        chapter_summary = (await summarize_chapter(
+            endpoint=endpoint,
+            model=model,
+            chapter_text=chapter_text,
+            timeout_sec=timeout_sec,
+            seed=seed,
+            cache_dir=cache_dir,
+            queue_timeout_sec=queue_timeout_sec,
+        )).strip()
+    except Exception as exc:
+        chapter_summary = f"Chapter {chapter_no} summary unavailable due to error: {exc}"
+
+    try:
+        story_memory = (await merge_memory(
+            endpoint=endpoint,
+            model=model,
+            previous_memory=previous_memory,
+            latest_summary=chapter_summary,
+            timeout_sec=timeout_sec,
+            seed=seed,
+            cache_dir=cache_dir,
+            queue_timeout_sec=queue_timeout_sec,
+        )).strip()
+    except Exception:
+        story_memory = recent_notes(previous_summaries, chapter_summary)
+
+    return chapter_summary, story_memory
+
+
+def chapter_system(spec: BookSpec) -> str:
+    return (
         f"You are writing a {spec.genre} novel chapter-by-chapter. "
         "Write natural prose with varied sentence rhythm and pacing. "
         "Avoid repetitive phrasing and avoid reusing prior paragraphs verbatim. "
         "No meta commentary. No outlines. No markdown."
     )
-    prompt = (
-        f"Book title: {spec.title}\n"
-        f"Genre: {spec.genre}\n"
-        f"Premise: {spec.premise}\n"
-        f"Tone: {spec.tone}\n"
+
+
+def build_static_prefix(spec: BookSpec) -> str:
+    """Return the part of the chapter prompt that never changes within a book.
+
+    Ollama reuses the KV cache for the longest prompt prefix shared with the
+    previous request in the same slot, so everything that is identical across
+    chapters goes first, byte-for-byte, and per-chapter content goes last.
+    """
+    if spec._static_prefix is None:
+        plan_lines = "\n".join(f"{i}. {plan}" for i, plan in enumerate(spec.chapter_plans, start=1))
+        spec._static_prefix = (
+            f"Book title: {spec.title}\n"
+            f"Genre: {spec.genre}\n"
+            f"Premise: {spec.premise}\n"
+            f"Tone: {spec.tone}\n\n"
+            "Chapter plan for the whole book (for orientation; write only the requested chapter):\n"
+            f"{plan_lines}\n\n"
+            "Instructions:\n"
+            "- Start with 'Chapter <number>: <title>' on the first line.\n"
+            "- Continue directly with prose scenes.\n"
+            "- Advance the story materially; include consequences from prior chapters.\n"
+            "- Do not jump ahead to events planned for later chapters.\n"
+            "- End with a clear hook into the next chapter.\n"
+            "- Output chapter text only.\n\n"
+        )
+    return spec._static_prefix
+
+
+def build_dynamic_suffix(
+    chapter_number: int,
+    story_memory: str,
+    chapter_goal: str,
+    target_words: int,
+    previous_ending: str = "",
+) -> str:
+    recent = f"The previous chapter (not yet in the summary) ended:\n{previous_ending}\n\n" if previous_ending else ""
+    return (
         f"Chapter number: {chapter_number}\n"
         f"Target chapter length: about {target_words} words (minimum {max(1200, target_words - 250)}).\n\n"
         "Story summary so far:\n"
         f"{story_memory}\n\n"
+        f"{recent}"
         "General plot objective for this chapter:\n"
         f"{chapter_goal}\n\n"
-        "Instructions:\n"
-        "- Start with 'Chapter {N}: <title>' on the first line.\n"
-        "- Continue directly with prose scenes.\n"
-        "- Advance the story materially; include consequences from prior chapters.\n"
-        "- End with a clear hook into the next chapter.\n"
-        "- Output chapter text only.\n"
-    ).replace("{N}", str(chapter_number))
-    return system, prompt
+        f"Write chapter {chapter_number} now, starting with 'Chapter {chapter_number}: <title>'.\n"
+    )
+
+
+def make_chapter_prompt(
+    spec: BookSpec,
+    chapter_number: int,
+    chapter_goal: str,
+    story_memory: str,
+    target_words: int,
+    previous_ending: str = "",
+) -> tuple[str, str]:
+    prompt = build_static_prefix(spec) + build_dynamic_suffix(
+        chapter_number=chapter_number,
+        story_memory=story_memory,
+        chapter_goal=chapter_goal,
+        target_words=target_words,
+        previous_ending=previous_ending,
+    )
+    return chapter_system(spec), prompt
+
+
+def make_continuation_prompt(prompt: str, draft: str, draft_words: int, target_words: int) -> str:
+    # Extends the original prompt, so the continuation shares its cached prefix.
+    return (
+        f"{prompt}\n"
+        "CHAPTER DRAFT SO FAR:\n"
+        f"{draft}\n\n"
+        f"The chapter above is {draft_words} words but must reach {target_words}. "
+        "Continue from the exact next sentence; do not restart or summarize. "
+        "Extend the current scenes and add dialogue. Output only the new text.\n"
+    )
 
 
 def manuscript_text(title: str, chapters: list[str]) -> str:
@@ -335,7 +970,119 @@ def manuscript_text(title: str, chapters: list[str]) -> str:
     return header + "\n\n".join(chapters).strip() + "\n"
 
 
-def generate_one_book(
+def write_manuscript(book_path: Path, title: str, chapters: list[str]) -> None:
+    # With no chapters yet, write only the header so append_chapter() can follow it.
+    # Bytes, not text mode, so the file layout matches the offsets kept in state.
+    book_path.write_bytes((manuscript_text(title, chapters) if chapters else f"{title}\n\n").encode("utf-8"))
+
+
+def legacy_chapter_bytes(body: bytes, committed: int) -> list[int] | None:
+    """Locate committed chapters in a manuscript from before offsets were recorded.
+
+    Walks the "Chapter 2", "Chapter 3", ... headings in order, each searched for
+    after the previous one, so a repeated or mid-text heading cannot shift the
+    boundaries. Returns None when the headings do not line up with the layout
+    append_chapter() writes.
+    """
+    if committed == 0:
+        return []
+    starts = [0]
+    for n in range(2, committed + 2):
+        match = re.compile(rb"(?im)^chapter\s+%d\b" % n).search(body, starts[-1] + 1)
+        if match is None:
+            if n <= committed:
+                return None
+            break
+        starts.append(match.start())
+    if len(starts) == committed:
+        ends = [s - 2 for s in starts[1:]] + [len(body) - 1]
+    else:
+        # A heading for the next chapter means it was appended but never committed.
+        ends = [s - 2 for s in starts[1:]]
+    if any(body[e:e + 2] != b"\n\n" for e in ends[:-1]) or body[ends[-1]:ends[-1] + 1] != b"\n":
+        return None
+    return [e - s for s, e in zip(starts, ends)]
+
+
+def load_chapters(book_path: Path, title: str, state: dict[str, Any]) -> list[str]:
+    """Return the committed chapters, making book_path hold exactly those.
+
+    Chapter text lives only in book_path; state records how many chapters are
+    committed and the UTF-8 byte length of each ("chapter_bytes"), so chapters
+    are sliced out by offset rather than found by scanning the prose for
+    headings. Bytes past the last committed chapter (one appended right before
+    a crash, whose state write never happened) are truncated. A file that does
+    not match the recorded layout, or that holds chapters while state records
+    none at all (no state file), is left untouched and RuntimeError is raised.
+    State files that still carry a "chapters" list are migrated by rewriting
+    the manuscript from them.
+    """
+    if "chapters" in state:
+        chapters = [str(c) for c in state.pop("chapters")]
+        state["chapter_count"] = len(chapters)
+        state["chapter_bytes"] = [len(c.encode("utf-8")) for c in chapters]
+        write_manuscript(book_path, title, chapters)
+        return chapters
+
+    committed = int(state.get("chapter_count", 0))
+    if not book_path.exists():
+        if committed:
+            log(f"{book_path.name} is missing but state expects {committed} chapters; starting over")
+        state["chapter_bytes"] = []
+        write_manuscript(book_path, title, [])
+        return []
+
+    header = f"{title}\n\n".encode("utf-8")
+    data = book_path.read_bytes()
+    if not data.startswith(header):
+        raise RuntimeError(f"{book_path} does not start with the title header; leaving it untouched")
+    if "chapter_count" not in state and "chapter_bytes" not in state and len(data) > len(header):
+        raise RuntimeError(f"{book_path} has text but no state recording its chapters; leaving it untouched")
+    if "chapter_bytes" not in state:
+        sizes = legacy_chapter_bytes(data[len(header):], committed)
+        if sizes is None:
+            raise RuntimeError(
+                f"{book_path} chapter headings do not match the {committed} committed chapters; leaving it untouched"
+            )
+        state["chapter_bytes"] = sizes
+    sizes = [int(n) for n in state["chapter_bytes"][:committed]]
+
+    chapters: list[str] = []
+    end = len(header)
+    for size in sizes:
+        start = end + 1 if chapters else end
+        if start + size + 1 > len(data):
+            break
+        if data[end:start] != b"\n" * (start - end) or data[start + size:start + size + 1] != b"\n":
+            raise RuntimeError(f"{book_path} does not match the recorded chapter sizes; leaving it untouched")
+        chapters.append(data[start:start + size].decode("utf-8"))
+        end = start + size + 1
+    if len(chapters) < committed:
+        if len(data) > end:
+            raise RuntimeError(f"{book_path} ends inside a committed chapter; leaving it untouched")
+        log(f"{book_path.name} has {len(chapters)} chapters but state expects {committed}; resuming from chapter {len(chapters) + 1}")
+    state["chapter_bytes"] = sizes[: len(chapters)]
+    if len(data) > end:
+        log(f"{book_path.name}: dropping {len(data) - end} bytes past the last committed chapter")
+        with book_path.open("r+b") as fh:
+            fh.truncate(end)
+    return chapters
+
+
+def append_chapter(book_path: Path, chapter_text: str, is_first: bool) -> int:
+    """Append a chapter exactly as manuscript_text() lays it out; return its UTF-8 size."""
+    encoded = chapter_text.encode("utf-8")
+    with book_path.open("ab") as fh:
+        if not is_first:
+            fh.write(b"\n")
+        fh.write(encoded)
+        fh.write(b"\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+    return len(encoded)
+
+
+async def generate_one_book(
     spec: BookSpec,
     output_dir: Path,
     endpoint: str,
@@ -344,126 +1091,188 @@ def generate_one_book(
     target_chapter_words: int,
     max_chapters: int,
     timeout_sec: int,
+    aux_timeout_sec: int,
     seed: int | None,
-) -> Path:
-    slug = re.sub(r"[^a-z0-9]+", "_", spec.title.lower()).strip("_")
+    cache_dir: Path | None,
+    memory_lag: int,
+    rounds: ChapterRounds | None = None,
+) -> tuple[Path, int]:
+    """Generate (or resume) one book; return its manuscript path and word count.
+
+    With memory_lag=1 the summary/memory update for chapter N runs while
+    chapter N+1 is being written, so chapter N+1 sees story memory through
+    chapter N-1 plus the closing lines of chapter N.
+    """
+    slug = SLUG_RE.sub("_", spec.title.lower()).strip("_")
     state_path = output_dir / f"{slug}.state.json"
     book_path = output_dir / f"{slug}.txt"
     meta_path = output_dir / f"{slug}.meta.json"
 
-    state = read_state(state_path) or {
+    loaded = read_state(state_path)
+    state = loaded or {
         "title": spec.title,
         "genre": spec.genre,
-        "chapters": [],
         "chapter_summaries": [],
         "story_memory": "No chapters yet.",
-        "created_at": datetime.now().isoformat(),
+        "created_at": time.time(),
     }
-    chapters: list[str] = list(state.get("chapters", []))
-    chapter_summaries: list[str] = list(state.get("chapter_summaries", []))
+    chapters = load_chapters(book_path, spec.title, state)
+    chapter_bytes: list[int] = list(state["chapter_bytes"])
+    chapter_summaries: list[str] = list(state.get("chapter_summaries", []))[: len(chapters)]
     story_memory: str = str(state.get("story_memory", "No chapters yet."))
+    # Words in manuscript_text(spec.title, chapters), kept up to date per chapter
+    # instead of re-tokenizing the whole growing manuscript. load_chapters() has
+    # just made book_path match exactly, so count it once from its raw bytes.
+    running_word_count = count_words(book_path.read_bytes())
 
-    while count_words(manuscript_text(spec.title, chapters)) < min_words and len(chapters) < max_chapters:
-        chapter_no = len(chapters) + 1
-        if chapter_no <= len(spec.chapter_plans):
-            chapter_goal = spec.chapter_plans[chapter_no - 1]
-        else:
-            chapter_goal = (
-                "Continue escalation from prior chapter, deepen character consequences, "
-                "and set up the final resolution without repeating earlier scenes."
-            )
-
-        log(f"{spec.genre.upper()} | generating chapter {chapter_no}")
-        system, prompt = make_chapter_prompt(
-            spec=spec,
-            chapter_number=chapter_no,
-            chapter_goal=chapter_goal,
-            story_memory=story_memory,
-            target_words=target_chapter_words,
+    async def save_progress() -> None:
+        state.update(
+            {
+                "chapter_count": len(chapters),
+                "chapter_bytes": chapter_bytes,
+                "chapter_summaries": chapter_summaries,
+                "story_memory": story_memory,
+                "updated_at": time.time(),
+                "word_count": running_word_count,
+            }
         )
-        chapter_text = ollama_generate(
-            endpoint=endpoint,
-            model=model,
-            system=system,
-            prompt=prompt,
-            timeout_sec=timeout_sec,
-            temperature=0.75,
-            seed=seed,
-        ).strip()
+        await save_state(state_path, state)
 
-        if not chapter_text.lower().startswith("chapter "):
-            chapter_text = f"Chapter {chapter_no}: Untitled\n\n{chapter_text}"
+    if loaded is None:
+        # Commit the empty book now, so a crash while appending chapter 1 is
+        # truncated on resume instead of looking like an unknown manuscript.
+        await save_progress()
 
-        ch_words = count_words(chapter_text)
-        if ch_words < max(900, target_chapter_words // 2):
-            log(
-                f"{spec.genre.upper()} | chapter {chapter_no} too short ({ch_words} words), regenerating with stricter length request"
+    def continuity_task(chapter_no: int, chapter_text: str) -> asyncio.Task[tuple[str, str]]:
+        return asyncio.create_task(
+            update_continuity(
+                endpoint=endpoint,
+                model=model,
+                chapter_no=chapter_no,
+                chapter_text=chapter_text,
+                previous_memory=story_memory,
+                previous_summaries=list(chapter_summaries),
+                timeout_sec=aux_timeout_sec,
+                seed=seed,
+                cache_dir=cache_dir,
+                queue_timeout_sec=AUX_QUEUE_TIMEOUT_SEC,
             )
-            system_retry, prompt_retry = make_chapter_prompt(
+        )
+
+    async def fold_in(task: asyncio.Task[tuple[str, str]]) -> None:
+        nonlocal story_memory
+        chapter_summary, updated_memory = await task
+        chapter_summaries.append(chapter_summary)
+        story_memory = keep_last_words(updated_memory, MEMORY_MAX_WORDS)
+
+    # Chapters whose summary was still pending when a previous run stopped.
+    while len(chapter_summaries) < len(chapters):
+        chapter_no = len(chapter_summaries) + 1
+        log(f"{spec.genre.upper()} | catching up summary for chapter {chapter_no}")
+        await fold_in(continuity_task(chapter_no, chapters[chapter_no - 1]))
+        await save_progress()
+
+    warmed = False
+    # Continuity update for the most recent chapter, awaited before the next one is committed.
+    pending: asyncio.Task[tuple[str, str]] | None = None
+    try:
+        while running_word_count < min_words and len(chapters) < max_chapters:
+            chapter_no = len(chapters) + 1
+            if chapter_no <= len(spec.chapter_plans):
+                chapter_goal = spec.chapter_plans[chapter_no - 1]
+            else:
+                chapter_goal = (
+                    "Continue escalation from prior chapter, deepen character consequences, "
+                    "and set up the final resolution without repeating earlier scenes."
+                )
+
+            log(f"{spec.genre.upper()} | generating chapter {chapter_no}")
+            # With memory lagging a chapter behind, show how the last chapter ended.
+            lagging = len(chapter_summaries) < len(chapters)
+            system, prompt = make_chapter_prompt(
                 spec=spec,
                 chapter_number=chapter_no,
-                chapter_goal=chapter_goal + " Write fuller scenes and dialogue.",
+                chapter_goal=chapter_goal,
                 story_memory=story_memory,
-                target_words=max(target_chapter_words, 2000),
+                target_words=target_chapter_words,
+                previous_ending=keep_last_words(chapters[-1], 150) if lagging else "",
             )
-            chapter_text = ollama_generate(
+            if not warmed:
+                warmed = True
+                # A cached replay never reaches the server; warming it would only force a model load.
+                if not has_cached_response(cache_dir, model, system, prompt, 0.75, seed):
+                    await warm_book_prefix(endpoint, model, spec, timeout_sec, seed)
+            if rounds is not None:
+                await rounds.ready()
+            chapter_text = (await ollama_generate(
                 endpoint=endpoint,
                 model=model,
-                system=system_retry,
-                prompt=prompt_retry,
+                system=system,
+                prompt=prompt,
                 timeout_sec=timeout_sec,
-                temperature=0.8,
+                temperature=0.75,
                 seed=seed,
-            ).strip()
-            ch_words = count_words(chapter_text)
+                cache_dir=cache_dir,
+            )).strip()
 
-        chapters.append(chapter_text)
+            if not chapter_text.lower().startswith("chapter "):
+                chapter_text = f"Chapter {chapter_no}: Untitled\n\n{chapter_text}"
 
-        try:
-            chapter_summary = summarize_chapter(
-                endpoint=endpoint,
-                model=model,
-                chapter_text=chapter_text,
-                timeout_sec=timeout_sec,
-                seed=seed,
-            ).strip()
-        except Exception as exc:
-            chapter_summary = f"Chapter {chapter_no} summary unavailable due to error: {exc}"
+            ch_words = count_words(chapter_text)
+            if ch_words < max(900, target_chapter_words // 2):
+                log(
+                    f"{spec.genre.upper()} | chapter {chapter_no} too short ({ch_words} words), requesting a continuation"
+                )
+                continuation = (await ollama_generate(
+                    endpoint=endpoint,
+                    model=model,
+                    system=system,
+                    prompt=make_continuation_prompt(prompt, chapter_text, ch_words, target_chapter_words),
+                    timeout_sec=timeout_sec,
+                    temperature=0.75,
+                    seed=seed,
+                    # Full 4096-token budget (~3000 words, more than any shortfall
+                    # here); raising it further would overflow num_ctx once the
+                    # draft is in the prompt. Mirostat holds perplexity steady so
+                    # the extension does not drift into repetition.
+                    num_predict=4096,
+                    mirostat=2,
+                    cache_dir=cache_dir,
+                )).strip()
+                # A restarted chapter heading would read as a second chapter.
+                if continuation.lower().startswith("chapter "):
+                    continuation = continuation.partition("\n")[2].strip()
+                if continuation:
+                    chapter_text = f"{chapter_text}\n\n{continuation}"
+                    ch_words = count_words(chapter_text)
 
-        chapter_summaries.append(chapter_summary)
+            chapters.append(chapter_text)
+            running_word_count += ch_words
+            chapter_bytes.append(append_chapter(book_path, chapter_text, is_first=len(chapters) == 1))
 
-        try:
-            story_memory = merge_memory(
-                endpoint=endpoint,
-                model=model,
-                previous_memory=story_memory,
-                latest_summary=chapter_summary,
-                timeout_sec=timeout_sec,
-                seed=seed,
-            ).strip()
-        except Exception:
-            tail = "\n".join(chapter_summaries[-5:])
-            story_memory = f"Recent continuity notes:\n{tail}"
+            if pending is not None:
+                await fold_in(pending)
+            pending = continuity_task(chapter_no, chapter_text)
+            if memory_lag == 0:
+                await fold_in(pending)
+                pending = None
 
-        state.update(
-            {
-                "chapters": chapters,
-                "chapter_summaries": chapter_summaries,
-                "story_memory": story_memory,
-                "updated_at": datetime.now().isoformat(),
-                "word_count": count_words(manuscript_text(spec.title, chapters)),
-            }
-        )
-        write_state(state_path, state)
+            # The manuscript append comes first; the state write then commits the chapter.
+            await save_progress()
+            log(
+                f"{spec.genre.upper()} | chapter {chapter_no} complete | chapter_words={ch_words} | total_words={running_word_count}"
+            )
 
-        manuscript = manuscript_text(spec.title, chapters)
-        book_path.write_text(manuscript, encoding="utf-8")
-        log(
-            f"{spec.genre.upper()} | chapter {chapter_no} complete | chapter_words={ch_words} | total_words={count_words(manuscript)}"
-        )
+        if pending is not None:
+            await fold_in(pending)
+            pending = None
+            await save_progress()
+    finally:
+        # Resume catches up on a summary that never landed.
+        if pending is not None:
+            pending.cancel()
 
-    manuscript = manuscript_text(spec.title, chapters)
-    total_words = count_words(manuscript)
+    total_words = running_word_count
     metadata = {
         "title": spec.title,
         "genre": spec.genre,
@@ -472,11 +1281,12 @@ def generate_one_book(
         "total_words": total_words,
         "chapters": len(chapters),
         "target_min_words": min_words,
-        "generated_at": datetime.now().isoformat(),
+        "created_at": iso_timestamp(state.get("created_at", time.time())),
+        "generated_at": iso_timestamp(time.time()),
         "state_file": str(state_path),
         "chapter_summaries": chapter_summaries,
     }
-    meta_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    write_json_file(meta_path, metadata)
 
     if total_words < min_words:
         raise RuntimeError(
@@ -484,22 +1294,86 @@ def generate_one_book(
             f"Increase --max-chapters or --target-chapter-words and rerun."
         )
 
-    return book_path
+    return book_path, total_words
 
 
 def parse_args() -> argparse.Namespace:
-    p = argparse.ArgumentParser(description="Generate long-form test books with Ollama.")
+    p = argparse.ArgumentParser(
+        description="Generate long-form test books with Ollama.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "The three books are generated concurrently. Start Ollama with enough\n"
+            "parallel slots for all of them to make progress at once, e.g.:\n"
+            "  OLLAMA_NUM_PARALLEL=3 OLLAMA_MAX_LOADED_MODELS=1 ollama serve\n"
+            "OLLAMA_NUM_PARALLEL=3 lets one request per book run at once;\n"
+            "OLLAMA_MAX_LOADED_MODELS=1 keeps a single copy of the model in memory.\n"
+            f"Requests ask Ollama to keep the model loaded for {KEEP_ALIVE} with\n"
+            f"num_ctx={NUM_CTX}; OLLAMA_KEEP_ALIVE on the server sets the default for\n"
+            "other clients.\n"
+            "With --memory-lag 1 (the default) each book has up to two requests in\n"
+            "flight, so OLLAMA_NUM_PARALLEL=6 lets all of them run at once."
+        ),
+    )
     p.add_argument("--model", default="llama3.1:8b", help="Ollama model name (default: llama3.1:8b)")
     p.add_argument("--endpoint", default="http://127.0.0.1:11434", help="Ollama base URL")
     p.add_argument("--output-dir", default="books/generated", help="Directory for generated manuscripts")
     p.add_argument("--min-words", type=int, default=40000, help="Minimum words per book")
     p.add_argument("--target-chapter-words", type=int, default=1800, help="Target words per generated chapter")
     p.add_argument("--max-chapters", type=int, default=32, help="Hard cap on chapters per book")
-    p.add_argument("--timeout-sec", type=int, default=240, help="Timeout per Ollama call")
+    p.add_argument("--timeout-sec", type=int, default=240, help="Timeout per chapter-writing Ollama call")
+    p.add_argument(
+        "--aux-timeout-sec",
+        type=int,
+        default=90,
+        help=(
+            "Timeout per summary/memory Ollama call, counted from its first streamed token; "
+            f"waiting for that token is bounded separately at {AUX_QUEUE_TIMEOUT_SEC}s (default: 90)"
+        ),
+    )
     p.add_argument("--seed", type=int, default=None, help="Optional seed for reproducibility")
+    p.add_argument(
+        "--memory-lag",
+        type=int,
+        choices=(0, 1),
+        default=1,
+        help="Chapters the story memory may trail behind; 1 overlaps each summary with the next chapter (default: 1)",
+    )
+    p.add_argument(
+        "--lockstep",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Send each round of chapter requests for all books together so Ollama can batch them; "
+            "continuation requests are not synchronized (default: off)"
+        ),
+    )
+    p.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Cache Ollama responses under <output-dir>/.cache (default: on when --seed is set)",
+    )
     return p.parse_args()
 
 
+async def gather_books(
+    specs: tuple[BookSpec, ...],
+    lockstep: bool,
+    **kwargs: Any,
+) -> list[tuple[Path, int] | BaseException]:
+    rounds = ChapterRounds(len(specs)) if lockstep else None
+
+    async def run(spec: BookSpec) -> tuple[Path, int]:
+        try:
+            return await generate_one_book(spec=spec, rounds=rounds, **kwargs)
+        finally:
+            if rounds is not None:
+                await rounds.leave()
+
+    # return_exceptions keeps the other books running when one of them fails.
+    return await asyncio.gather(*(run(spec) for spec in specs), return_exceptions=True)
+
+
 def main() -> int:
     args = parse_args()
     output_dir = Path(args.output_dir).resolve()
@@ -510,11 +1384,18 @@ def main() -> int:
     log(f"Output directory: {output_dir}")
     log(f"Model: {args.model}")
 
-    generated: list[Path] = []
-    for spec in default_specs():
+    use_cache = args.cache if args.cache is not None else args.seed is not None
+    cache_dir = output_dir / ".cache" if use_cache else None
+    if cache_dir is not None:
+        log(f"Response cache: {cache_dir}")
+
+    specs = default_specs()
+    for spec in specs:
         log(f"Starting book generation: {spec.title} ({spec.genre})")
-        out_path = generate_one_book(
-            spec=spec,
+    results = asyncio.run(
+        gather_books(
+            specs,
+            lockstep=args.lockstep,
             output_dir=output_dir,
             endpoint=args.endpoint,
             model=args.model,
@@ -522,14 +1403,27 @@ def main() -> int:
             target_chapter_words=args.target_chapter_words,
             max_chapters=args.max_chapters,
             timeout_sec=args.timeout_sec,
+            aux_timeout_sec=args.aux_timeout_sec,
             seed=args.seed,
+            cache_dir=cache_dir,
+            memory_lag=args.memory_lag,
         )
-        generated.append(out_path)
-        log(f"Completed: {out_path}")
+    )
+
+    generated: list[tuple[Path, int]] = []
+    failures: list[BaseException] = []
+    for spec, result in zip(specs, results):
+        if isinstance(result, BaseException):
+            log(f"Failed: {spec.title} ({spec.genre}): {result}")
+            failures.append(result)
+        else:
+            log(f"Completed: {result[0]}")
+            generated.append(result)
+    if failures:
+        raise failures[0]
 
     log("All books generated successfully:")
-    for pth in generated:
-        words = count_words(pth.read_text(encoding="utf-8"))
+    for pth, words in generated:
         log(f"- {pth.name}: {words} words")
     return 0
 